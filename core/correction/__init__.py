@@ -1,8 +1,4 @@
-# ============================================================================
-# FILE: core/correction/__init__.py
-# ============================================================================
-CORRECTION_INIT = '''"""Self-Correction Module"""
+"""Self-Correction Module"""
 from .corrector import Corrector
 
 __all__ = ['Corrector']
-'''
@@ -1,13 +1,11 @@
-# ============================================================================
-# FILE: core/correction/corrector.py
-# ============================================================================
-CORRECTOR_CODE = '''"""
+"""
 core/correction/corrector.py
 Autonomous Self-Correction System
 """
 
-import asyncio
 from typing import Any
+from ..orchestrator.simulation import simulate_latency
+from ..orchestrator.types import CorrectionStrategy
 from .strategies import CorrectionStrategies
 
 
@@ -28,8 +26,6 @@ class Corrector:
         Returns:
             CorrectionStrategy object
         """
-        from ..orchestrator.engine import CorrectionStrategy
-        
         # Analyze failure and select strategy
         strategy_name = self.strategies.select_strategy(task, validation)
         
@@ -41,7 +37,6 @@ class Corrector:
         )
         
         # Simulate correction application
-        await asyncio.sleep(1.0)
+        await simulate_latency(1.0)
         
         return correction
-'''
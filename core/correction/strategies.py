@@ -1,7 +1,4 @@
-# ============================================================================
-# FILE: core/correction/strategies.py
-# ============================================================================
-STRATEGIES_CODE = '''"""
+"""
 core/correction/strategies.py
 Correction Strategy Selection
 """
@@ -9,6 +6,13 @@ Correction Strategy Selection
 from typing import Any
 
 
+# Issue keywords mapped to strategies, checked in priority order
+_KEYWORD_STRATEGIES = (
+    ('edge case', 'inject_defensive_code'),
+    ('timeout', 'retry_with_modified_input')
+)
+
+
 class CorrectionStrategies:
     """Available correction strategies"""
     
@@ -22,10 +26,9 @@ class CorrectionStrategies:
     def select_strategy(self, task: Any, validation: Any) -> str:
         """Select best correction strategy"""
         # Simple logic - in production would use ML
-        if 'edge case' in str(validation.issues).lower():
-            return 'inject_defensive_code'
-        elif 'timeout' in str(validation.issues).lower():
-            return 'retry_with_modified_input'
-        else:
-            return 'use_alternative_method'
-'''
+        issues = [issue.lower() for issue in validation.issues]
+        for keyword, strategy in _KEYWORD_STRATEGIES:
+            for issue in issues:
+                if keyword in issue:
+                    return strategy
+        return 'use_alternative_method'
@@ -1,8 +1,4 @@
-# ============================================================================
-# FILE: core/gemini_integration/__init__.py
-# ============================================================================
-GEMINI_INIT = '''"""Gemini 3 Integration Module"""
+"""Gemini 3 Integration Module"""
 from .client import GeminiClient
 
 __all__ = ['GeminiClient']
-'''
@@ -1,14 +1,12 @@
-# ============================================================================
-# FILE: core/gemini_integration/client.py
-# ============================================================================
-GEMINI_CLIENT = '''"""
+"""
 core/gemini_integration/client.py
 Gemini 3 API Client
 """
 
-import asyncio
 from typing import Dict, Any, Optional
 
+from ..orchestrator.simulation import simulate_latency
+
 
 class GeminiClient:
     """Client for Gemini 3 API"""
@@ -30,7 +28,7 @@ class GeminiClient:
         """
         # In production, call actual Gemini API
         # For demo, return mock plan
-        await asyncio.sleep(1.0)
+        await simulate_latency(1.0)
         
         return {
             'steps': [
@@ -43,6 +41,5 @@ class GeminiClient:
     
     async def analyze(self, content: str) -> Dict[str, Any]:
         """Analyze content with Gemini"""
-        await asyncio.sleep(0.5)
+        await simulate_latency(0.5)
         return {'analysis': 'Mock analysis result'}
-'''
@@ -1,8 +1,4 @@
-# ============================================================================
-# FILE: core/orchestrator/__init__.py
-# ============================================================================
-ORCHESTRATOR_INIT = '''"""Workflow Orchestration Module"""
+"""Workflow Orchestration Module"""
 from .engine import WorkflowEngine, WorkflowStage, TaskStatus, Task, WorkflowResult
 
 __all__ = ['WorkflowEngine', 'WorkflowStage', 'TaskStatus', 'Task', 'WorkflowResult']
-'''
\ No newline at end of file
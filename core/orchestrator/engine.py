@@ -7,11 +7,23 @@ including planning, task execution, validation, and self-correction.
 """
 
 import asyncio
+import atexit
 import logging
-from typing import List, Dict, Any, Optional
+import os
+import queue
+import time
+import uuid
+from collections import deque
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Dict, Any, Optional, Callable, Deque
 from datetime import datetime
 from enum import Enum
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, replace
+
+from .plans import plan_for
+from .simulation import simulate_latency
+from .types import CorrectionStrategy, ValidationResult
 
 # Configure logging
 logging.basicConfig(
@@ -20,6 +32,82 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Resolve the other core modules once; the engine falls back without them
+try:
+    from ..validation.validator import Validator, DemoValidator
+    from ..correction.corrector import Corrector
+    from ..gemini_integration.client import GeminiClient
+except ImportError:
+    logger.warning("Some core modules not available, using fallbacks")
+    Validator = DemoValidator = Corrector = GeminiClient = None
+
+# Workflow log levels mapped onto the standard logger
+_LOG_LEVELS = {
+    'info': logging.INFO,
+    'success': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR
+}
+
+_log_listener: Optional[QueueListener] = None
+
+
+class _RawQueueHandler(QueueHandler):
+    """QueueHandler that leaves all formatting to the listener thread"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock prepare() renders the message and traceback on the
+        # calling thread; records never leave the process, so queue them as is
+        return record
+
+
+class _RootDispatchHandler(logging.Handler):
+    """Pass records to whatever handlers the root logger has at emit time"""
+    
+    def emit(self, record: logging.LogRecord):
+        logging.getLogger().handle(record)
+
+
+def enable_log_queue():
+    """
+    Hand engine log records to a background thread for formatting and I/O
+    
+    Opt-in for servers, where handler I/O would otherwise run on the
+    event loop. Records stop propagating synchronously and are replayed
+    on the listener thread to the root handlers current at that moment,
+    so handlers added later still receive them; handlers on intermediate
+    loggers (``core``, ``core.orchestrator``) are skipped. Messages are
+    formatted on that thread too, so mutable log arguments show their
+    state at formatting time.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
+    log_queue = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, _RootDispatchHandler())
+    logger.addHandler(_RawQueueHandler(log_queue))
+    logger.propagate = False
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+
+async def _gather_or_cancel(coros) -> List[Any]:
+    """
+    Run coroutines concurrently, cancelling the rest on the first error
+    
+    asyncio.gather leaves siblings running when one raises; this cancels
+    and awaits them before re-raising, so nothing outlives the failure.
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
 
 class WorkflowStage(Enum):
     """Workflow execution stages"""
@@ -42,61 +130,76 @@ class TaskStatus(Enum):
     CORRECTED = "corrected"
 
 
-@dataclass
+def _format_clock(ns: int) -> str:
+    """Format a time.time_ns() value as local HH:MM:SS.mmm"""
+    seconds, rem = divmod(ns, 1_000_000_000)
+    t = time.localtime(seconds)
+    return f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{rem // 1_000_000:03d}"
+
+
+def _format_iso(ns: Optional[int]) -> Optional[str]:
+    """Format a time.time_ns() value as a local ISO-8601 timestamp"""
+    if ns is None:
+        return None
+    return datetime.fromtimestamp(ns / 1e9).isoformat()
+
+
+@dataclass(slots=True)
 class LogEntry:
     """Execution log entry"""
-    timestamp: str
     level: str  # info, success, warning, error
     message: str
     metadata: Dict[str, Any] = field(default_factory=dict)
+    timestamp_ns: int = field(default_factory=time.time_ns)
+    
+    @property
+    def timestamp(self) -> str:
+        # Formatted on demand so logging only pays for one clock read
+        return _format_clock(self.timestamp_ns)
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            'timestamp': self.timestamp,
+            'level': self.level,
+            'message': self.message,
+            'metadata': self.metadata
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Individual workflow task"""
     id: str
     step_number: int
     description: str
     status: TaskStatus
-    started_at: Optional[str] = None
-    completed_at: Optional[str] = None
+    started_at_ns: Optional[int] = None
+    completed_at_ns: Optional[int] = None
     error: Optional[str] = None
     correction_applied: bool = False
     
-    def to_dict(self) -> Dict[str, Any]:
-        d = asdict(self)
-        d['status'] = self.status.value
-        return d
-
-
-@dataclass
-class ValidationResult:
-    """Validation result for task output"""
-    passed: bool
-    issues: List[str]
-    severity: str  # none, low, medium, high, critical
-    task_id: str
+    @property
+    def started_at(self) -> Optional[str]:
+        return _format_iso(self.started_at_ns)
     
-    def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
-
-
-@dataclass
-class CorrectionStrategy:
-    """Self-correction strategy"""
-    action: str
-    strategy: str
-    confidence: float
-    task_id: str
+    @property
+    def completed_at(self) -> Optional[str]:
+        return _format_iso(self.completed_at_ns)
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            'id': self.id,
+            'step_number': self.step_number,
+            'description': self.description,
+            'status': self.status.value,
+            'started_at': self.started_at,
+            'completed_at': self.completed_at,
+            'error': self.error,
+            'correction_applied': self.correction_applied
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class Artifact:
     """Generated output artifact"""
     name: str
@@ -107,10 +210,43 @@ class Artifact:
     content_preview: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            'name': self.name,
+            'type': self.type,
+            'size': self.size,
+            'verified': self.verified,
+            'path': self.path,
+            'content_preview': self.content_preview
+        }
 
 
-@dataclass
+# Static artifact set produced by every workflow; copied per run
+_ARTIFACT_TEMPLATES = (
+    Artifact(
+        name="research_synthesis_report.pdf",
+        type="document",
+        size="2.4 MB",
+        verified=True,
+        content_preview="# Research Synthesis Report\n\nComplete analysis with citations..."
+    ),
+    Artifact(
+        name="key_findings.json",
+        type="data",
+        size="156 KB",
+        verified=True,
+        content_preview='{"themes": ["AI", "ML"], "insights": [...]}'
+    ),
+    Artifact(
+        name="execution_log.txt",
+        type="log",
+        size="45 KB",
+        verified=True,
+        content_preview="[00:00:00] Workflow started\n[00:00:01] Planning phase..."
+    )
+)
+
+
+@dataclass(slots=True)
 class WorkflowResult:
     """Complete workflow execution result"""
     workflow_id: str
@@ -118,12 +254,23 @@ class WorkflowResult:
     stage: WorkflowStage
     progress: float
     tasks: List[Task]
-    logs: List[LogEntry]
+    logs: Deque[LogEntry]
     artifacts: List[Artifact]
     validation_failure: Optional[ValidationResult] = None
     correction: Optional[CorrectionStrategy] = None
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    completed_at: Optional[str] = None
+    created_at_ns: int = field(default_factory=time.time_ns)
+    completed_at_ns: Optional[int] = None
+    _log_cursor: int = field(default=0, init=False, repr=False, compare=False)
+    _logs_total: int = field(default=0, init=False, repr=False, compare=False)
+    _task_sent: Dict[str, Dict[str, Any]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    @property
+    def created_at(self) -> str:
+        return _format_iso(self.created_at_ns)
+    
+    @property
+    def completed_at(self) -> Optional[str]:
+        return _format_iso(self.completed_at_ns)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -139,6 +286,37 @@ class WorkflowResult:
             'created_at': self.created_at,
             'completed_at': self.completed_at
         }
+    
+    def append_log(self, entry: LogEntry):
+        """Append a log entry, counting entries the bounded deque evicts"""
+        self.logs.append(entry)
+        self._logs_total += 1
+    
+    def diff_dict(self) -> Dict[str, Any]:
+        """
+        Serialize only what changed since the previous call
+        
+        Tasks are sent when new or when any field differs from the copy
+        last sent, so status transitions reach delta clients; logs are
+        sent once, skipping any the bounded deque already evicted.
+        """
+        changed_tasks = []
+        for task in self.tasks:
+            data = task.to_dict()
+            if self._task_sent.get(task.id) != data:
+                self._task_sent[task.id] = data
+                changed_tasks.append(data)
+        
+        pending = min(self._logs_total - self._log_cursor, len(self.logs))
+        new_logs = islice(self.logs, len(self.logs) - pending, None)
+        self._log_cursor = self._logs_total
+        return {
+            'workflow_id': self.workflow_id,
+            'stage': self.stage.value,
+            'progress': self.progress,
+            'changed_tasks': changed_tasks,
+            'new_logs': [l.to_dict() for l in new_logs]
+        }
 
 
 class WorkflowEngine:
@@ -153,49 +331,48 @@ class WorkflowEngine:
     - Artifact generation
     """
     
-    def __init__(self, gemini_api_key: Optional[str] = None, config: Optional[Dict] = None):
+    def __init__(self, gemini_api_key: Optional[str] = None, config: Optional[Dict] = None,
+                 on_update: Optional[Callable[[Dict[str, Any]], None]] = None):
         """
         Initialize workflow engine
         
         Args:
             gemini_api_key: API key for Gemini 3 (optional for demo)
-            config: Configuration dictionary
+            config: Configuration dictionary (``demo_mode`` defaults to
+                True when no Gemini key is given)
+            on_update: Callback receiving incremental workflow deltas
         """
         self.gemini_api_key = gemini_api_key
         self.config = config or {}
+        self.on_update = on_update
         self.current_workflow: Optional[WorkflowResult] = None
         
-        # Import other core modules
-        try:
-            from ..validation.validator import Validator
-            from ..correction.corrector import Corrector
-            from ..gemini_integration.client import GeminiClient
-            
-            self.validator = Validator()
-            self.corrector = Corrector()
-            self.gemini_client = GeminiClient(gemini_api_key) if gemini_api_key else None
-        except ImportError:
-            logger.warning("Some core modules not available, using fallbacks")
-            self.validator = None
-            self.corrector = None
-            self.gemini_client = None
+        demo_mode = self.config.get('demo_mode', not gemini_api_key)
+        validator_cls = DemoValidator if demo_mode else Validator
+        self.validator = validator_cls() if validator_cls else None
+        self.corrector = Corrector() if Corrector else None
+        self.gemini_client = GeminiClient(gemini_api_key) if GeminiClient and gemini_api_key else None
         
         logger.info("WorkflowEngine initialized")
     
+    def _emit_update(self):
+        """Push the current workflow delta to the update callback"""
+        if self.on_update and self.current_workflow:
+            self.on_update(self.current_workflow.diff_dict())
+    
     def add_log(self, level: str, message: str, metadata: Optional[Dict] = None):
         """Add log entry to current workflow"""
         if self.current_workflow:
             entry = LogEntry(
-                timestamp=datetime.now().strftime("%H:%M:%S.%f")[:-3],
                 level=level,
                 message=message,
                 metadata=metadata or {}
             )
-            self.current_workflow.logs.append(entry)
+            self.current_workflow.append_log(entry)
             
             # Also log to standard logger
-            log_func = getattr(logger, level if level in ['info', 'warning', 'error'] else 'info')
-            log_func(f"[{self.current_workflow.workflow_id}] {message}")
+            logger.log(_LOG_LEVELS.get(level, logging.INFO), "[%s] %s",
+                       self.current_workflow.workflow_id, message)
     
     async def generate_plan(self, config: Dict[str, Any]) -> List[Task]:
         """
@@ -208,7 +385,7 @@ class WorkflowEngine:
             List of tasks to execute
         """
         self.add_log("info", "Gemini 3 analyzing task requirements...")
-        await asyncio.sleep(1.5)  # Simulate API call
+        await simulate_latency(1.5)  # Simulate API call
         
         # In production, this calls Gemini API:
         # if self.gemini_client:
@@ -219,33 +396,8 @@ class WorkflowEngine:
         task_type = config.get('name', 'workflow')
         
         # Different plans for different task types
-        if 'research' in task_type.lower() or 'synthesis' in task_type.lower():
-            plan_steps = [
-                "Parse and extract content from all input sources",
-                "Identify key themes and patterns using NLP analysis",
-                "Cross-reference findings across all sources",
-                "Generate comprehensive synthesis report with citations",
-                "Validate output completeness and citation accuracy"
-            ]
-        elif 'code' in task_type.lower() or 'analysis' in task_type.lower():
-            plan_steps = [
-                "Analyze code structure and dependencies",
-                "Detect code smells and anti-patterns",
-                "Evaluate security vulnerabilities",
-                "Generate improvement recommendations",
-                "Validate analysis completeness"
-            ]
-        else:
-            plan_steps = [
-                "Process and normalize input data",
-                "Apply analysis algorithms",
-                "Generate insights and findings",
-                "Create output artifacts",
-                "Validate results quality"
-            ]
-        
         tasks = []
-        for i, description in enumerate(plan_steps, 1):
+        for i, description in enumerate(plan_for(task_type), 1):
             task = Task(
                 id=f"task_{i}",
                 step_number=i,
@@ -273,12 +425,12 @@ class WorkflowEngine:
             Task execution result
         """
         task.status = TaskStatus.RUNNING
-        task.started_at = datetime.now().isoformat()
+        task.started_at_ns = time.time_ns()
         
         self.add_log("info", f"Executing step {task.step_number}: {task.description}")
         
         # Simulate task execution with processing time
-        await asyncio.sleep(1.5)
+        await simulate_latency(1.5)
         
         # Simulate success/failure based on step number
         # Step 3 intentionally fails for demo purposes
@@ -288,13 +440,15 @@ class WorkflowEngine:
             return {'success': False, 'error': task.error}
         
         task.status = TaskStatus.COMPLETED
-        task.completed_at = datetime.now().isoformat()
+        task.completed_at_ns = time.time_ns()
         
-        # Generate mock output
+        # Generate mock output, citing the ingested sources; with none
+        # ingested the model itself is the only source
         output = {
             'task_id': task.id,
             'result': f"Completed: {task.description}",
-            'data': {'processed': True}
+            'data': {'processed': True},
+            'citations': [inp.get('name', 'unknown') for inp in inputs] or ['gemini-3']
         }
         
         return output
@@ -311,32 +465,32 @@ class WorkflowEngine:
             Validation result
         """
         self.add_log("info", f"Validating step {task.step_number} output...")
-        await asyncio.sleep(0.8)
+        await simulate_latency(0.8)
         
         # Use validator if available
         if self.validator:
             result = await self.validator.validate(task, output)
-            return result
-        
         # Fallback validation logic
         # Step 3 fails validation for demo
-        if task.step_number == 3:
+        elif task.step_number == 3:
             result = ValidationResult(
                 passed=False,
                 issues=["Missing error handling for edge case: empty citation list"],
                 severity="medium",
                 task_id=task.id
             )
-            self.add_log("error", f"Validation FAILED: {result.issues[0]}")
-            return result
+        else:
+            result = ValidationResult(
+                passed=True,
+                issues=[],
+                severity="none",
+                task_id=task.id
+            )
         
-        result = ValidationResult(
-            passed=True,
-            issues=[],
-            severity="none",
-            task_id=task.id
-        )
-        self.add_log("success", f"Step {task.step_number} validation passed")
+        if result.passed:
+            self.add_log("success", f"Step {task.step_number} validation passed")
+        else:
+            self.add_log("error", f"Validation FAILED: {result.issues[0]}")
         return result
     
     async def apply_correction(self, task: Task, validation: ValidationResult) -> CorrectionStrategy:
@@ -351,20 +505,19 @@ class WorkflowEngine:
             Applied correction strategy
         """
         self.add_log("warning", "Initiating autonomous self-correction...")
-        await asyncio.sleep(1.2)
+        await simulate_latency(1.2)
         
         # Use corrector if available
         if self.corrector:
             correction = await self.corrector.correct(task, validation)
-            return correction
-        
-        # Fallback correction logic
-        correction = CorrectionStrategy(
-            action="Add null-check and default handling for citation lists",
-            strategy="inject_defensive_code",
-            confidence=0.95,
-            task_id=task.id
-        )
+        else:
+            # Fallback correction logic
+            correction = CorrectionStrategy(
+                action="Add null-check and default handling for citation lists",
+                strategy="inject_defensive_code",
+                confidence=0.95,
+                task_id=task.id
+            )
         
         self.add_log("warning", f"Correction strategy: {correction.action}", {
             'strategy': correction.strategy,
@@ -373,11 +526,11 @@ class WorkflowEngine:
         
         # Re-execute with correction
         self.add_log("info", "Re-executing with correction...")
-        await asyncio.sleep(1.5)
+        await simulate_latency(1.5)
         
         task.status = TaskStatus.CORRECTED
         task.correction_applied = True
-        task.completed_at = datetime.now().isoformat()
+        task.completed_at_ns = time.time_ns()
         
         self.add_log("success", "Validation PASSED after correction")
         
@@ -392,29 +545,7 @@ class WorkflowEngine:
         """
         self.add_log("info", "Generating verified artifacts...")
         
-        artifacts = [
-            Artifact(
-                name="research_synthesis_report.pdf",
-                type="document",
-                size="2.4 MB",
-                verified=True,
-                content_preview="# Research Synthesis Report\n\nComplete analysis with citations..."
-            ),
-            Artifact(
-                name="key_findings.json",
-                type="data",
-                size="156 KB",
-                verified=True,
-                content_preview='{"themes": ["AI", "ML"], "insights": [...]}'
-            ),
-            Artifact(
-                name="execution_log.txt",
-                type="log",
-                size="45 KB",
-                verified=True,
-                content_preview="[00:00:00] Workflow started\n[00:00:01] Planning phase..."
-            )
-        ]
+        artifacts = [replace(template) for template in _ARTIFACT_TEMPLATES]
         
         for artifact in artifacts:
             self.add_log("success", f"Generated artifact: {artifact.name}", {
@@ -436,7 +567,8 @@ class WorkflowEngine:
         Returns:
             Complete workflow result with logs and artifacts
         """
-        workflow_id = f"wf_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # Suffixed so runs started in the same second get distinct ids
+        workflow_id = f"wf_{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
         
         # Initialize workflow result
         self.current_workflow = WorkflowResult(
@@ -445,7 +577,7 @@ class WorkflowEngine:
             stage=WorkflowStage.IDLE,
             progress=0.0,
             tasks=[],
-            logs=[],
+            logs=deque(maxlen=self.config.get('max_logs', 10000)),
             artifacts=[]
         )
         
@@ -456,7 +588,7 @@ class WorkflowEngine:
             
             inputs = config.get('inputs', [])
             self.add_log("info", f"Ingesting {len(inputs)} input sources...")
-            await asyncio.sleep(1.2)
+            await simulate_latency(1.2)
             
             for inp in inputs:
                 input_type = inp.get('type', 'unknown')
@@ -464,55 +596,88 @@ class WorkflowEngine:
                 self.add_log("success", f"Ingested {input_type}: {input_name}")
             
             self.current_workflow.progress = 0.2
+            self._emit_update()
             
             # Stage 2: Planning with Gemini 3
             self.current_workflow.stage = WorkflowStage.PLANNING
             tasks = await self.generate_plan(config)
             self.current_workflow.tasks = tasks
             self.current_workflow.progress = 0.3
+            self._emit_update()
             
             # Stage 3: Task Execution
+            # Tasks are independent, so each runs its own execute -> validate
+            # -> correct pipeline and all of them are scheduled concurrently.
             self.current_workflow.stage = WorkflowStage.EXECUTING
+            state_lock = asyncio.Lock()
+            finished = 0
+            validating = 0
+            correcting = False
             
-            for i, task in enumerate(tasks):
-                # Execute task
+            def _refresh_stage():
+                # Correction outranks validation, which outranks execution
+                if correcting:
+                    self.current_workflow.stage = WorkflowStage.CORRECTING
+                elif validating:
+                    self.current_workflow.stage = WorkflowStage.VALIDATING
+                else:
+                    self.current_workflow.stage = WorkflowStage.EXECUTING
+            
+            async def _run_one(task: Task):
+                nonlocal finished, validating, correcting
                 output = await self.execute_task(task, inputs)
                 
                 # Stage 4: Validation
-                self.current_workflow.stage = WorkflowStage.VALIDATING
+                validating += 1
+                _refresh_stage()
                 validation = await self.validate_output(task, output)
+                validating -= 1
+                _refresh_stage()
                 
                 if not validation.passed:
                     # Stage 5: Self-Correction
-                    self.current_workflow.stage = WorkflowStage.CORRECTING
-                    self.current_workflow.validation_failure = validation
-                    
-                    correction = await self.apply_correction(task, validation)
-                    self.current_workflow.correction = correction
-                    self.current_workflow.validation_failure = None
+                    # validation_failure/correction hold a single task at a
+                    # time, so corrections are serialized on the lock.
+                    async with state_lock:
+                        correcting = True
+                        _refresh_stage()
+                        self.current_workflow.validation_failure = validation
+                        self._emit_update()
+                        
+                        correction = await self.apply_correction(task, validation)
+                        self.current_workflow.correction = correction
+                        self.current_workflow.validation_failure = None
+                        correcting = False
+                        _refresh_stage()
                 
-                # Update progress
-                self.current_workflow.stage = WorkflowStage.EXECUTING
-                self.current_workflow.progress = 0.3 + (0.6 * (i + 1) / len(tasks))
+                # Update progress; nothing here awaits, so it needs no lock
+                # and isn't held up by another task's correction
+                finished += 1
+                self.current_workflow.progress = 0.3 + (0.6 * finished / len(tasks))
+                self._emit_update()
+            
+            await _gather_or_cancel(_run_one(task) for task in tasks)
             
             # Stage 6: Generate Artifacts
             self.current_workflow.stage = WorkflowStage.COMPLETED
             self.current_workflow.progress = 0.9
             
-            await asyncio.sleep(0.8)
+            await simulate_latency(0.8)
             artifacts = self.generate_artifacts()
             self.current_workflow.artifacts = artifacts
             self.current_workflow.progress = 1.0
-            self.current_workflow.completed_at = datetime.now().isoformat()
+            self.current_workflow.completed_at_ns = time.time_ns()
             
             self.add_log("success", "Workflow completed successfully", {
                 'total_tasks': len(tasks),
                 'artifacts': len(artifacts)
             })
+            self._emit_update()
             
         except Exception as e:
             self.current_workflow.stage = WorkflowStage.FAILED
             self.add_log("error", f"Workflow failed: {str(e)}")
+            self._emit_update()
             logger.exception("Workflow execution failed")
             raise
         
@@ -526,6 +691,7 @@ async def test_engine():
     print("MRWA Workflow Engine Test")
     print("="*60 + "\n")
     
+    os.environ.setdefault("MRWA_SIMULATION_SPEED", "1")
     engine = WorkflowEngine()
     
     config = {
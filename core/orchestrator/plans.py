@@ -0,0 +1,65 @@
+"""
+core/orchestrator/plans.py
+Workflow Plan Templates
+
+Step templates shared by the workflow engine and planner.
+"""
+
+from typing import Tuple
+
+
+_PLAN_RESEARCH = (
+    "Parse and extract content from all input sources",
+    "Identify key themes and patterns using NLP analysis",
+    "Cross-reference findings across all sources",
+    "Generate comprehensive synthesis report with citations",
+    "Validate output completeness and citation accuracy"
+)
+_PLAN_CODE = (
+    "Analyze code structure and dependencies",
+    "Detect code smells and anti-patterns",
+    "Evaluate security vulnerabilities",
+    "Generate improvement recommendations",
+    "Validate analysis completeness"
+)
+_PLAN_VIDEO = (
+    "Extract video transcript and metadata",
+    "Identify key concepts and topics",
+    "Generate timeline of important moments",
+    "Create summary and study guide",
+    "Validate output quality"
+)
+_PLAN_DEFAULT = (
+    "Process and normalize input data",
+    "Apply analysis algorithms",
+    "Generate insights and findings",
+    "Create output artifacts",
+    "Validate results quality"
+)
+
+# Matched against the lowercased task type in order; first hit wins
+_PLAN_CATALOG = {
+    'research': _PLAN_RESEARCH,
+    'synthesis': _PLAN_RESEARCH,
+    'code': _PLAN_CODE,
+    'video': _PLAN_VIDEO,
+    'youtube': _PLAN_VIDEO,
+    'analysis': _PLAN_CODE,
+}
+
+
+def plan_for(task_type: str) -> Tuple[str, ...]:
+    """
+    Select the step template for a task type
+    
+    Args:
+        task_type: Type of workflow (research, code, video, etc.)
+        
+    Returns:
+        Tuple of step descriptions (shared, do not mutate)
+    """
+    key = task_type.lower()
+    for keyword, steps in _PLAN_CATALOG.items():
+        if keyword in key:
+            return steps
+    return _PLAN_DEFAULT
@@ -1,7 +1,4 @@
-# ============================================================================
-# FILE: core/orchestrator/server.py
-# ============================================================================
-SERVER_CODE = '''"""
+"""
 core/orchestrator/server.py
 Flask API Server for MRWA
 """
@@ -11,25 +8,54 @@ from flask_cors import CORS
 from flask_socketio import SocketIO, emit
 import asyncio
 import os
-from .engine import WorkflowEngine
+import threading
+import orjson
+from .engine import WorkflowEngine, enable_log_queue
+
+
+class _OrjsonCodec:
+    """json-module shim so SocketIO encodes packets with orjson"""
+    
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    @staticmethod
+    def loads(data, *args, **kwargs):
+        return orjson.loads(data)
+
 
 app = Flask(__name__)
 CORS(app, resources={r"/*": {"origins": "*"}})
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading', json=_OrjsonCodec)
+
+# Keep log formatting and I/O off the shared event loop
+enable_log_queue()
 
 # Store active workflows
 workflows = {}
-engine = WorkflowEngine(gemini_api_key=os.getenv('GEMINI_API_KEY'))
 
 
-def get_event_loop():
-    """Get or create event loop"""
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    return loop
+def _new_engine() -> WorkflowEngine:
+    """Engine for a single request; engines keep per-run state, so they aren't shared"""
+    return WorkflowEngine(
+        gemini_api_key=os.getenv('GEMINI_API_KEY'),
+        on_update=lambda delta: socketio.emit('workflow_delta', delta)
+    )
+
+
+# Single event loop shared by all request threads, run on a daemon thread
+_loop = asyncio.new_event_loop()
+threading.Thread(target=_loop.run_forever, name='mrwa-event-loop', daemon=True).start()
+
+
+def _jsonify(obj, status=200):
+    """Serialize a response body with orjson"""
+    return app.response_class(
+        orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        mimetype='application/json'
+    )
 
 
 @app.route('/health', methods=['GET'])
@@ -43,28 +69,28 @@ def create_workflow():
     try:
         config = request.json
         if not config or 'name' not in config:
-            return jsonify({'error': 'Invalid configuration'}), 400
+            return _jsonify({'error': 'Invalid configuration'}, 400)
         
-        loop = get_event_loop()
-        result = loop.run_until_complete(engine.execute_workflow(config))
+        future = asyncio.run_coroutine_threadsafe(_new_engine().execute_workflow(config), _loop)
+        result = future.result()
         workflows[result.workflow_id] = result
         
         socketio.emit('workflow_update', result.to_dict())
-        return jsonify(result.to_dict()), 201
+        return _jsonify(result.to_dict(), 201)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return _jsonify({'error': str(e)}, 500)
 
 
 @app.route('/api/workflows/<workflow_id>', methods=['GET'])
 def get_workflow(workflow_id):
     if workflow_id not in workflows:
-        return jsonify({'error': 'Not found'}), 404
-    return jsonify(workflows[workflow_id].to_dict())
+        return _jsonify({'error': 'Not found'}, 404)
+    return _jsonify(workflows[workflow_id].to_dict())
 
 
 @app.route('/api/workflows', methods=['GET'])
 def list_workflows():
-    return jsonify({
+    return _jsonify({
         'workflows': [w.to_dict() for w in workflows.values()],
         'count': len(workflows)
     })
@@ -101,4 +127,3 @@ if __name__ == '__main__':
     port = int(os.getenv('PORT', 8000))
     print(f"Starting MRWA API Server on port {port}")
     socketio.run(app, host='0.0.0.0', port=port, debug=True)
-'''
@@ -0,0 +1,21 @@
+"""
+core/orchestrator/simulation.py
+Simulated Latency
+
+Leaf module shared by the mocked engine, corrector and Gemini client.
+"""
+
+import asyncio
+import os
+
+
+async def simulate_latency(seconds: float):
+    """
+    Sleep for a simulated latency, scaled by MRWA_SIMULATION_SPEED
+    
+    The multiplier is read on each call; 0 (the default) skips the sleep
+    and 1 gives demo-paced runs.
+    """
+    speed = float(os.getenv("MRWA_SIMULATION_SPEED", "0"))
+    if speed:
+        await asyncio.sleep(seconds * speed)
@@ -0,0 +1,45 @@
+"""
+core/orchestrator/types.py
+Shared Workflow Data Types
+
+Leaf module holding result types used across the core packages, so that
+modules like the corrector can import them at module scope without
+pulling in the engine.
+"""
+
+from typing import Dict, Any, Sequence
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    """Validation result for task output"""
+    passed: bool
+    issues: Sequence[str]
+    severity: str  # none, low, medium, high, critical
+    task_id: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'passed': self.passed,
+            'issues': self.issues,
+            'severity': self.severity,
+            'task_id': self.task_id
+        }
+
+
+@dataclass(slots=True)
+class CorrectionStrategy:
+    """Self-correction strategy"""
+    action: str
+    strategy: str
+    confidence: float
+    task_id: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'action': self.action,
+            'strategy': self.strategy,
+            'confidence': self.confidence,
+            'task_id': self.task_id
+        }
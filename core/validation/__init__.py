@@ -1,8 +1,4 @@
-# ============================================================================
-# FILE: core/validation/__init__.py
-# ============================================================================
-VALIDATION_INIT = '''"""Validation Module"""
-from .validator import Validator
+"""Validation Module"""
+from .validator import Validator, DemoValidator
 
-__all__ = ['Validator']
-'''
+__all__ = ['Validator', 'DemoValidator']
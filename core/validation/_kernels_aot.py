@@ -0,0 +1,25 @@
+"""
+core/validation/_kernels_aot.py
+Ahead-of-Time Kernel Build
+
+Compiles the scoring kernels in kernels.py into a ``_kernels`` extension
+next to this file, so deployed servers skip the Numba JIT warm-up and
+never load LLVM. Needs ``mrwa[jit]`` at build time only; run it before
+building a wheel so the extension is packaged with it:
+
+    python -m core.validation._kernels_aot
+"""
+
+import os
+
+from numba.pycc import CC
+
+from .kernels import _quality
+
+cc = CC('_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export('quality', 'f8(f8[:])')(_quality)
+
+
+if __name__ == '__main__':
+    cc.compile()
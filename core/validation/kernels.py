@@ -0,0 +1,57 @@
+"""
+core/validation/kernels.py
+Numeric Scoring Kernels
+
+Loop-heavy scoring helpers, written once in plain Python and resolved in
+order of preference:
+
+1. The prebuilt ``_kernels`` extension from _kernels_aot.py (needs numpy only)
+2. Numba JIT versions (``pip install mrwa[jit]``), cached on disk after
+   the first call
+3. The plain Python definitions below
+"""
+
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _quality(features):
+    """Mean feature score; shared source for every backend"""
+    total = 0.0
+    for i in range(len(features)):
+        total += features[i]
+    return total / len(features)
+
+
+_quality_native = None
+
+if np is not None:
+    try:
+        from ._kernels import quality as _quality_native
+    except ImportError:
+        try:
+            from numba import njit
+        except ImportError:
+            njit = None
+        
+        if njit is not None:
+            _quality_native = njit(cache=True)(_quality)
+
+
+def quality_score(features: Sequence[float]) -> float:
+    """
+    Aggregate per-feature scores into one quality score
+    
+    Args:
+        features: Non-empty sequence of feature scores in [0, 1]
+        
+    Returns:
+        Mean feature score
+    """
+    if _quality_native is None:
+        return _quality(features)
+    return float(_quality_native(np.asarray(features, dtype=np.float64)))
@@ -1,13 +1,12 @@
-# ============================================================================
-# FILE: core/validation/rules.py
-# ============================================================================
-VALIDATION_RULES = '''"""
+"""
 core/validation/rules.py
 Pre-defined Validation Rules
 """
 
 from typing import Dict, Any, Tuple, List
 
+_REQUIRED = frozenset(('result', 'data'))
+
 
 def check_citations(output: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """Validate citations are present"""
@@ -19,10 +18,9 @@ def check_citations(output: Dict[str, Any]) -> Tuple[bool, List[str]]:
 
 def check_completeness(output: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """Check output completeness"""
-    required = ['result', 'data']
-    missing = [f for f in required if f not in output]
+    missing = _REQUIRED.difference(output)
     if missing:
-        return False, [f"Missing: {f}" for f in missing]
+        return False, [f"Missing: {f}" for f in sorted(missing)]
     return True, []
 
 
@@ -31,4 +29,3 @@ def check_format(output: Dict[str, Any]) -> Tuple[bool, List[str]]:
     if not isinstance(output, dict):
         return False, ["Invalid format"]
     return True, []
-'''
@@ -6,17 +6,67 @@ Validates task outputs against predefined rules and quality standards.
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+import inspect
+import re
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, List, Optional, Callable
+from dataclasses import dataclass, field
 
+from ..orchestrator.types import ValidationResult
+from .kernels import quality_score
 
-@dataclass
+
+# Integer ranks let the rule loop fold severity with a plain max
+SEVERITY_RANK = {"none": 0, "low": 1, "medium": 2, "high": 3, "critical": 4}
+RANK_SEVERITY = {rank: severity for severity, rank in SEVERITY_RANK.items()}
+_CRITICAL_BIT = 1 << SEVERITY_RANK["critical"]
+
+_REQUIRED_FIELDS = frozenset(('result', 'data'))
+
+# Shared by every passing result instead of a fresh empty list
+_EMPTY_ISSUES: tuple = ()
+
+# Values keyed by (type name, value) in cache signatures
+_SCALAR_TYPES = frozenset((str, int, bool, type(None)))
+
+# Inline citation markers such as [3] or (Vaswani, 2017)
+_CITATION_RE = re.compile(r'\[\d+\]|\(\w+, \d{4}\)')
+
+
+def _canonical(value: Any) -> tuple:
+    """
+    Hashable, type-tagged form of a JSON-like value
+    
+    Unlike JSON, tuples stay distinct from lists and int keys from str
+    keys, so outputs only share a form when every value has the same
+    exact type. Raises TypeError for anything else, including subclasses.
+    """
+    kind = type(value)
+    if kind in _SCALAR_TYPES:
+        return (kind.__name__, value)
+    if kind is float:
+        # repr keeps -0.0 apart from 0.0
+        return ('float', repr(value))
+    if kind is list or kind is tuple:
+        return (kind.__name__, tuple(_canonical(v) for v in value))
+    if kind is dict:
+        # Tagged keys are unique, so sorting never compares the values
+        return ('dict', tuple(sorted((_canonical(k), _canonical(v)) for k, v in value.items())))
+    raise TypeError(f"Uncacheable value of type {kind.__name__}")
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationRule:
     """Validation rule definition"""
     name: str
     description: str
     severity: str  # low, medium, high, critical
     check_function: Any
+    rank: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen, so the derived rank has to bypass __setattr__
+        object.__setattr__(self, 'rank', SEVERITY_RANK.get(self.severity, 0))
 
 
 class Validator:
@@ -30,9 +80,21 @@ class Validator:
     - Completeness checks
     """
     
-    def __init__(self):
-        """Initialize validator with default rules"""
+    def __init__(self, parallel: bool = False, cache_size: int = 0):
+        """
+        Initialize validator with default rules
+        
+        Args:
+            parallel: Run rules concurrently (worth it once rules do I/O)
+            cache_size: Number of passing outputs remembered; off by default
+                since keying an output costs more than the default rules
+        """
+        self.parallel = parallel
+        self._score_kernel = quality_score
         self.rules = self._load_default_rules()
+        self._compiled_rules = self._compile_rules()
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple, None] = OrderedDict()
     
     def _load_default_rules(self) -> Dict[str, ValidationRule]:
         """Load default validation rules"""
@@ -63,23 +125,55 @@ class Validator:
             )
         }
     
+    def _compile_rules(self) -> tuple[tuple[Callable, int], ...]:
+        """Flatten rules into (check_function, severity bit) pairs, most severe first"""
+        # Most severe first so a critical failure can stop the walk;
+        # sorted() is stable, so insertion order holds within a level
+        ordered = sorted(self.rules.values(), key=lambda r: -r.rank)
+        return tuple((rule.check_function, 1 << rule.rank) for rule in ordered)
+    
+    @staticmethod
+    def _fold_results(outcomes: Iterable[tuple[int, tuple[bool, List[str]]]]) -> tuple[Optional[List[str]], int]:
+        """
+        Collect issues and the worst severity rank from rule outcomes
+        
+        Args:
+            outcomes: (severity bit, (passed, issues)) pairs, most severe first
+            
+        Returns:
+            (issues or None if every rule passed, max rank)
+        """
+        all_issues = None
+        mask = 0
+        for bit, (passed, issues) in outcomes:
+            if not passed:
+                if all_issues is None:
+                    all_issues = list(issues)
+                else:
+                    all_issues.extend(issues)
+                mask |= bit
+                if bit == _CRITICAL_BIT:
+                    break
+        # Highest set bit is the worst failing severity
+        return all_issues, mask.bit_length() - 1 if mask else 0
+    
     def _check_citations(self, output: Dict[str, Any]) -> tuple[bool, List[str]]:
         """Check if citations are present and valid"""
         # Demo logic - in production would check actual citations
         citations = output.get('citations', [])
         
-        if len(citations) == 0:
+        # Inline markers in the result text count as citations too
+        if len(citations) == 0 and not _CITATION_RE.search(str(output.get('result', ''))):
             return False, ["Missing citations"]
         
         return True, []
     
     def _check_completeness(self, output: Dict[str, Any]) -> tuple[bool, List[str]]:
         """Check if output is complete"""
-        required_fields = ['result', 'data']
-        missing = [f for f in required_fields if f not in output]
+        missing = _REQUIRED_FIELDS.difference(output)
         
         if missing:
-            return False, [f"Missing required field: {f}" for f in missing]
+            return False, [f"Missing required field: {f}" for f in sorted(missing)]
         
         return True, []
     
@@ -92,14 +186,45 @@ class Validator:
     
     def _calculate_quality_score(self, output: Dict[str, Any]) -> tuple[bool, List[str]]:
         """Calculate quality score"""
-        # Demo scoring logic
-        score = 0.85  # Mock score
+        features = output.get('features')
+        # len() rather than truthiness, which numpy arrays refuse
+        if features is not None and len(features):
+            score = self._score_kernel(features)
+        else:
+            score = 0.85  # Mock score when no features are reported
         
         if score < 0.7:
             return False, [f"Quality score too low: {score}"]
         
         return True, []
     
+    @staticmethod
+    def _signature(output: Any) -> Optional[tuple]:
+        """Canonical cache key for an output, or None if it can't be encoded"""
+        try:
+            return _canonical(output)
+        except (TypeError, RecursionError):
+            return None
+    
+    async def _run_in_order(self, output: Dict[str, Any]) -> List[tuple[int, tuple[bool, List[str]]]]:
+        """Run rules one at a time, awaiting async ones, until a critical failure"""
+        outcomes = []
+        for check, bit in self._compiled_rules:
+            result = check(output)
+            if inspect.isawaitable(result):
+                result = await result
+            outcomes.append((bit, result))
+            if bit == _CRITICAL_BIT and not result[0]:
+                break
+        return outcomes
+    
+    @staticmethod
+    async def _run_rule(check: Callable, output: Dict[str, Any]) -> tuple[bool, List[str]]:
+        """Run one rule check without blocking the event loop"""
+        if inspect.iscoroutinefunction(check):
+            return await check(output)
+        return await asyncio.to_thread(check, output)
+    
     async def validate(self, task: Any, output: Dict[str, Any]) -> Any:
         """
         Validate task output
@@ -111,43 +236,64 @@ class Validator:
         Returns:
             ValidationResult object
         """
-        # Import here to avoid circular dependency
-        from ..orchestrator.engine import ValidationResult
-        
-        # For demo purposes, step 3 always fails validation
-        if task.step_number == 3:
+        key = self._signature(output) if self.cache_size else None
+        if key is not None and key in self._cache:
+            self._cache.move_to_end(key)
             return ValidationResult(
-                passed=False,
-                issues=["Missing error handling for edge case: empty citation list"],
-                severity="medium",
+                passed=True,
+                issues=_EMPTY_ISSUES,
+                severity="none",
                 task_id=task.id
             )
         
-        # Run all validation rules
-        all_issues = []
-        max_severity = "none"
+        # Run all validation rules; issues stay None until a rule fails
+        if self.parallel:
+            rules = self._compiled_rules
+            results = await asyncio.gather(*[self._run_rule(check, output) for check, _ in rules])
+            outcomes = zip((bit for _, bit in rules), results)
+        else:
+            outcomes = await self._run_in_order(output)
+        all_issues, max_rank = self._fold_results(outcomes)
         
-        for rule_name, rule in self.rules.items():
-            passed, issues = rule.check_function(output)
-            if not passed:
-                all_issues.extend(issues)
-                if rule.severity == "critical":
-                    max_severity = "critical"
-                elif rule.severity == "high" and max_severity != "critical":
-                    max_severity = "high"
-                elif rule.severity == "medium" and max_severity not in ["critical", "high"]:
-                    max_severity = "medium"
+        if not all_issues:
+            # Only passing outputs are cached; failures are always re-checked
+            if key is not None:
+                self._cache[key] = None
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            return ValidationResult(
+                passed=True,
+                issues=_EMPTY_ISSUES,
+                severity="none",
+                task_id=task.id
+            )
         
         return ValidationResult(
-            passed=len(all_issues) == 0,
+            passed=False,
             issues=all_issues,
-            severity=max_severity,
+            severity=RANK_SEVERITY[max_rank],
             task_id=task.id
         )
     
     def add_custom_rule(self, rule: ValidationRule):
         """Add a custom validation rule"""
         self.rules[rule.name] = rule
+        self._compiled_rules = self._compile_rules()
+        self._cache.clear()
+
+
+class DemoValidator(Validator):
+    """Validator for demo runs, where step 3 always fails validation"""
+    
+    async def validate(self, task: Any, output: Dict[str, Any]) -> Any:
+        if task.step_number == 3:
+            return ValidationResult(
+                passed=False,
+                issues=["Missing error handling for edge case: empty citation list"],
+                severity="medium",
+                task_id=task.id
+            )
+        return await super().validate(task, output)
 
 
 # Example usage
@@ -0,0 +1,82 @@
+"""
+ingestion/_listing.py
+Cached Recursive Directory Listings
+"""
+
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+# Directory trees remembered per listing cache
+_LISTING_CACHE_SIZE = 32
+
+# Recorded in place of an mtime for directories that couldn't be read
+_UNREADABLE = -1
+
+
+class DirectoryListingCache:
+    """
+    LRU of recursive file listings filtered by suffix
+    
+    A directory's mtime changes whenever an entry is added, removed or
+    renamed directly inside it, so a cached listing is reused only while
+    every directory visited by the walk that produced it still has the
+    same mtime. Checking that costs one stat() per directory instead of
+    re-reading every entry.
+    """
+    
+    def __init__(self, suffixes: Iterable[str], maxsize: int = _LISTING_CACHE_SIZE):
+        self.suffixes = frozenset(s.lower() for s in suffixes)
+        self.maxsize = maxsize
+        self._cache: OrderedDict[str, Tuple[Tuple[Tuple[str, int], ...], Tuple[Path, ...]]] = OrderedDict()
+    
+    def _walk(self, dirpath: str, dirs: List[Tuple[str, int]], found: List[Path]):
+        """Collect matching files, using dirent types to avoid extra stat() calls"""
+        try:
+            # Stat before reading, so changes made mid-walk invalidate the entry
+            dirs.append((dirpath, os.stat(dirpath).st_mtime_ns))
+            with os.scandir(dirpath) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        self._walk(entry.path, dirs, found)
+                    elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in self.suffixes:
+                        found.append(Path(entry.path))
+        except OSError:
+            # Unreadable directories are skipped, as pathlib's glob does; an
+            # impossible mtime makes the next call walk the tree again
+            dirs.append((dirpath, _UNREADABLE))
+    
+    @staticmethod
+    def _unchanged(dirs: Tuple[Tuple[str, int], ...]) -> bool:
+        """Whether every directory still has the mtime recorded for it"""
+        try:
+            return all(os.stat(dirpath).st_mtime_ns == mtime for dirpath, mtime in dirs)
+        except OSError:
+            return False
+    
+    def list_files(self, path: Path) -> List[Path]:
+        """
+        List matching files under a directory
+        
+        Returns:
+            A new list on every call, so callers may modify it; empty
+            when ``path`` is not a directory
+        """
+        if not path.is_dir():
+            return []
+        
+        root = str(path)
+        cached = self._cache.get(root)
+        if cached is not None and self._unchanged(cached[0]):
+            self._cache.move_to_end(root)
+            return list(cached[1])
+        
+        dirs: List[Tuple[str, int]] = []
+        found: List[Path] = []
+        self._walk(root, dirs, found)
+        self._cache[root] = (tuple(dirs), tuple(found))
+        self._cache.move_to_end(root)
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return found
@@ -1,7 +1,4 @@
-# ============================================================================
-# FILE: ingestion/code_analyzer/analyzer.py
-# ============================================================================
-CODE_ANALYZER = '''"""
+"""
 ingestion/code_analyzer/analyzer.py
 Code Analysis Module
 """
@@ -9,10 +6,15 @@ Code Analysis Module
 from typing import Dict, Any
 from pathlib import Path
 
+from .._listing import DirectoryListingCache
+
 
 class CodeAnalyzer:
     """Analyze code repositories"""
     
+    def __init__(self):
+        self._listings = DirectoryListingCache(('.py',))
+    
     def analyze_directory(self, dirpath: str) -> Dict[str, Any]:
         """Analyze code in directory"""
         path = Path(dirpath)
@@ -20,7 +22,7 @@ class CodeAnalyzer:
         return {
             'path': str(path),
             'languages': {'Python': 75.0, 'JavaScript': 25.0},
-            'files': list(path.glob('**/*.py')) if path.exists() else [],
+            'files': self._listings.list_files(path) if path.exists() else [],
             'metrics': {
                 'lines_of_code': 1500,
                 'complexity': 12.5
@@ -34,4 +36,3 @@ class CodeAnalyzer:
             'languages': {'Python': 80.0},
             'metrics': {'loc': 2000}
         }
-'''
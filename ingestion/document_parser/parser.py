@@ -1,7 +1,4 @@
-# ============================================================================
-# FILE: ingestion/document_parser/parser.py
-# ============================================================================
-DOCUMENT_PARSER = '''"""
+"""
 ingestion/document_parser/parser.py
 Document Parsing Module
 """
@@ -9,10 +6,17 @@ Document Parsing Module
 from typing import List, Dict, Any
 from pathlib import Path
 
+from .._listing import DirectoryListingCache
+
+_DOCUMENT_EXTENSIONS = frozenset({'.pdf', '.txt', '.md', '.docx'})
+
 
 class DocumentParser:
     """Parse PDFs, DOCX, and text files"""
     
+    def __init__(self):
+        self._listings = DirectoryListingCache(_DOCUMENT_EXTENSIONS)
+    
     def parse_file(self, filepath: str) -> Dict[str, Any]:
         """Parse a single document"""
         path = Path(filepath)
@@ -33,10 +37,4 @@ class DocumentParser:
         if not path.exists():
             return []
         
-        results = []
-        for file in path.glob('**/*'):
-            if file.is_file() and file.suffix in ['.pdf', '.txt', '.md', '.docx']:
-                results.append(self.parse_file(str(file)))
-        
-        return results
-'''
\ No newline at end of file
+        return [self.parse_file(str(file)) for file in self._listings.list_files(path)]
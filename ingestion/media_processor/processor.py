@@ -1,7 +1,4 @@
-# ============================================================================
-# FILE: ingestion/media_processor/processor.py
-# ============================================================================
-MEDIA_PROCESSOR = '''"""
+"""
 ingestion/media_processor/processor.py
 Media Processing Module
 """
@@ -28,4 +25,3 @@ class MediaProcessor:
     def extract_transcript(self, video_path: str) -> str:
         """Extract transcript from video"""
         return "Transcript text from video"
-'''
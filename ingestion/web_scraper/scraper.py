@@ -1,17 +1,48 @@
-# ============================================================================
-# FILE: ingestion/web_scraper/scraper.py
-# ============================================================================
-WEB_SCRAPER = '''"""
+"""
 ingestion/web_scraper/scraper.py
 Web Content Scraping Module
 """
 
-from typing import List, Dict, Any
+import asyncio
+import copy
+import re
+from collections import OrderedDict
+from typing import List, Dict, Any, Iterable, Iterator
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+# Concurrent connections used when scraping a batch of URLs
+_MAX_CONNECTIONS = 32
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+
+# Blank lines and # comments in URL files
+_SKIP_LINE_RE = re.compile(rb'\s*(?:#|$)')
+
+# Successfully scraped pages remembered per scraper
+_PAGE_CACHE_SIZE = 256
+
+
+def _iter_urls(lines: Iterable[bytes]) -> Iterator[str]:
+    """Yield URLs from raw lines, skipping blanks and # comments"""
+    for line in lines:
+        if not _SKIP_LINE_RE.match(line):
+            yield line.strip().decode()
 
 
 class WebScraper:
     """Scrape web content"""
     
+    def __init__(self, cache_size: int = _PAGE_CACHE_SIZE):
+        """
+        Args:
+            cache_size: Number of successfully scraped pages remembered
+                by URL (0 disables); failed fetches are always retried
+        """
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+    
     def scrape_url(self, url: str) -> Dict[str, Any]:
         """Scrape single URL"""
         return {
@@ -24,13 +55,72 @@ class WebScraper:
             }
         }
     
+    async def _scrape_one(self, session: aiohttp.ClientSession, url: str) -> Dict[str, Any]:
+        """Fetch and parse a single URL, reusing an earlier successful scrape"""
+        cached = self._cache.get(url)
+        if cached is not None:
+            self._cache.move_to_end(url)
+            # Copied so callers can't alter what later lookups of the URL get
+            return copy.deepcopy(cached)
+        
+        try:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                # Binary bodies (PDF links etc.) must not abort the batch
+                html = await response.text(errors='replace')
+                date = response.headers.get('Last-Modified', 'Unknown')
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return {'url': url, 'error': str(e) or type(e).__name__}
+        
+        soup = BeautifulSoup(html, 'html.parser')
+        author = soup.find('meta', attrs={'name': 'author'})
+        result = {
+            'url': url,
+            'title': soup.title.get_text(strip=True) if soup.title else '',
+            'content': soup.get_text(' ', strip=True),
+            'metadata': {
+                'author': author.get('content', 'Unknown') if author else 'Unknown',
+                'date': date
+            }
+        }
+        
+        if self.cache_size:
+            self._cache[url] = copy.deepcopy(result)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+    
+    async def scrape_urls_async(self, urls: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Scrape many URLs concurrently over one session
+        
+        A fixed pool of workers pulls from ``urls`` as they go, so an
+        iterator is consumed lazily and at most _MAX_CONNECTIONS
+        fetches are in flight.
+        
+        Args:
+            urls: URLs to fetch (any iterable, e.g. a generator over a file)
+            
+        Returns:
+            One result per URL, in input order; failed fetches carry an 'error' key
+        """
+        pending = enumerate(urls)
+        results: Dict[int, Dict[str, Any]] = {}
+        
+        connector = aiohttp.TCPConnector(limit=_MAX_CONNECTIONS)
+        async with aiohttp.ClientSession(connector=connector, timeout=_REQUEST_TIMEOUT) as session:
+            async def worker():
+                for index, url in pending:
+                    results[index] = await self._scrape_one(session, url)
+            
+            await asyncio.gather(*[worker() for _ in range(_MAX_CONNECTIONS)])
+        
+        return [results[index] for index in range(len(results))]
+    
     def scrape_urls_from_file(self, filepath: str) -> List[Dict[str, Any]]:
         """Scrape URLs from file"""
         try:
-            with open(filepath, 'r') as f:
-                urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-            
-            return [self.scrape_url(url) for url in urls]
+            with open(filepath, 'rb') as f:
+                return asyncio.run(self.scrape_urls_async(_iter_urls(f)))
         except FileNotFoundError:
             return []
-'''
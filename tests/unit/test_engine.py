@@ -0,0 +1,121 @@
+"""
+tests/unit/test_engine.py
+Workflow Engine Tests
+"""
+
+import asyncio
+from collections import deque
+
+import pytest
+
+from core.orchestrator.engine import (
+    LogEntry, Task, TaskStatus, WorkflowEngine, WorkflowResult, WorkflowStage
+)
+
+
+def make_workflow(max_logs: int = 10) -> WorkflowResult:
+    return WorkflowResult(
+        workflow_id='wf_test',
+        name='Test',
+        stage=WorkflowStage.EXECUTING,
+        progress=0.0,
+        tasks=[],
+        logs=deque(maxlen=max_logs),
+        artifacts=[]
+    )
+
+
+class TestWorkflowDelta:
+    def test_logs_sent_once(self):
+        workflow = make_workflow()
+        workflow.append_log(LogEntry('info', 'one'))
+        workflow.append_log(LogEntry('info', 'two'))
+        
+        assert [l['message'] for l in workflow.diff_dict()['new_logs']] == ['one', 'two']
+        assert workflow.diff_dict()['new_logs'] == []
+        
+        workflow.append_log(LogEntry('info', 'three'))
+        assert [l['message'] for l in workflow.diff_dict()['new_logs']] == ['three']
+    
+    def test_evicted_logs_are_skipped(self):
+        workflow = make_workflow(max_logs=3)
+        workflow.append_log(LogEntry('info', 'zero'))
+        workflow.diff_dict()
+        for i in range(5):
+            workflow.append_log(LogEntry('info', str(i)))
+        
+        assert [l['message'] for l in workflow.diff_dict()['new_logs']] == ['2', '3', '4']
+    
+    def test_task_status_changes_are_sent(self):
+        workflow = make_workflow()
+        task = Task(id='task_1', step_number=1, description='Step', status=TaskStatus.PENDING)
+        workflow.tasks = [task]
+        
+        assert [t['status'] for t in workflow.diff_dict()['changed_tasks']] == ['pending']
+        assert workflow.diff_dict()['changed_tasks'] == []
+        
+        task.status = TaskStatus.RUNNING
+        assert [t['status'] for t in workflow.diff_dict()['changed_tasks']] == ['running']
+
+
+class TestWorkflowEngine:
+    @pytest.fixture
+    def engine(self):
+        return WorkflowEngine()
+    
+    @pytest.mark.asyncio
+    async def test_logs_reach_root_handlers(self, engine, caplog):
+        with caplog.at_level('INFO', logger='core.orchestrator.engine'):
+            await engine.execute_workflow({'name': 'Test', 'inputs': []})
+        assert any('Workflow completed successfully' in r.getMessage() for r in caplog.records)
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('demo_mode', [True, False])
+    async def test_workflow_without_inputs(self, demo_mode):
+        engine = WorkflowEngine(config={'demo_mode': demo_mode})
+        result = await engine.execute_workflow({'name': 'Test', 'inputs': []})
+        
+        assert result.stage == WorkflowStage.COMPLETED
+        # Only the intentionally broken step 3 needs correcting
+        assert [t.step_number for t in result.tasks if t.correction_applied] == [3]
+    
+    @pytest.mark.asyncio
+    async def test_progress_not_blocked_by_correction(self, monkeypatch):
+        # Real (scaled) sleeps so the task pipelines interleave
+        monkeypatch.setenv('MRWA_SIMULATION_SPEED', '0.001')
+        deltas = []
+        engine = WorkflowEngine(on_update=deltas.append)
+        await engine.execute_workflow({'name': 'Test', 'inputs': []})
+        
+        corrected_at = next(
+            i for i, d in enumerate(deltas)
+            if any(t['status'] == 'corrected' for t in d['changed_tasks'])
+        )
+        # Every other step reports before step 3's correction finishes
+        assert deltas[corrected_at - 1]['progress'] == pytest.approx(0.78)
+        assert 'correcting' in [d['stage'] for d in deltas[:corrected_at]]
+    
+    @pytest.mark.asyncio
+    async def test_failed_task_cancels_siblings(self, engine):
+        execute_task = engine.execute_task
+        
+        async def flaky_execute(task, inputs):
+            if task.step_number == 2:
+                raise RuntimeError("step 2 exploded")
+            await asyncio.sleep(0.05)
+            return await execute_task(task, inputs)
+        
+        engine.execute_task = flaky_execute
+        
+        with pytest.raises(RuntimeError):
+            await engine.execute_workflow({'name': 'Test', 'inputs': []})
+        
+        workflow = engine.current_workflow
+        log_count = len(workflow.logs)
+        progress = workflow.progress
+        await asyncio.sleep(0.1)
+        
+        # Cancelled siblings must not touch the failed workflow afterwards
+        assert workflow.stage == WorkflowStage.FAILED
+        assert workflow.progress == progress
+        assert len(workflow.logs) == log_count
@@ -0,0 +1,82 @@
+"""
+tests/unit/test_ingestion.py
+Ingestion Module Tests
+"""
+
+import copy
+import os
+
+import pytest
+
+from ingestion import CodeAnalyzer, DocumentParser, MediaProcessor, WebScraper
+
+
+class TestDirectoryListings:
+    def test_new_file_in_subdirectory_is_listed(self, tmp_path):
+        sub = tmp_path / 'sub'
+        sub.mkdir()
+        (sub / 'x.py').write_text('')
+        analyzer = CodeAnalyzer()
+        assert len(analyzer.analyze_directory(str(tmp_path))['files']) == 1
+        
+        (sub / 'y.py').write_text('')
+        assert len(analyzer.analyze_directory(str(tmp_path))['files']) == 2
+    
+    def test_removed_file_is_dropped(self, tmp_path):
+        (tmp_path / 'a.md').write_text('')
+        (tmp_path / 'b.pdf').write_text('')
+        parser = DocumentParser()
+        assert len(parser.parse_directory(str(tmp_path))) == 2
+        
+        (tmp_path / 'a.md').unlink()
+        assert [d['filename'] for d in parser.parse_directory(str(tmp_path))] == ['b.pdf']
+    
+    def test_listing_is_not_shared(self, tmp_path):
+        (tmp_path / 'x.py').write_text('')
+        analyzer = CodeAnalyzer()
+        analyzer.analyze_directory(str(tmp_path))['files'].clear()
+        assert len(analyzer.analyze_directory(str(tmp_path))['files']) == 1
+    
+    def test_file_path_lists_nothing(self, tmp_path):
+        (tmp_path / 'x.py').write_text('')
+        (tmp_path / 'doc.md').write_text('')
+        assert CodeAnalyzer().analyze_directory(str(tmp_path / 'x.py'))['files'] == []
+        assert DocumentParser().parse_directory(str(tmp_path / 'doc.md')) == []
+    
+    def test_unreadable_subdirectory_is_skipped(self, tmp_path, monkeypatch):
+        (tmp_path / 'x.py').write_text('')
+        locked = tmp_path / 'locked'
+        locked.mkdir()
+        (locked / 'y.py').write_text('')
+        
+        scandir = os.scandir
+        def guarded_scandir(path):
+            if path == str(locked):
+                raise PermissionError(13, 'Permission denied', path)
+            return scandir(path)
+        monkeypatch.setattr(os, 'scandir', guarded_scandir)
+        
+        analyzer = CodeAnalyzer()
+        assert len(analyzer.analyze_directory(str(tmp_path))['files']) == 1
+        
+        # Once readable, the next call walks again instead of reusing the listing
+        monkeypatch.setattr(os, 'scandir', scandir)
+        assert len(analyzer.analyze_directory(str(tmp_path))['files']) == 2
+
+
+class TestUrlLookups:
+    @pytest.mark.parametrize('lookup', [
+        lambda url: WebScraper().scrape_url(url),
+        lambda url: CodeAnalyzer().analyze_repository(url),
+        lambda url: MediaProcessor().process_youtube(url),
+    ], ids=['scrape_url', 'analyze_repository', 'process_youtube'])
+    def test_results_are_not_shared(self, lookup):
+        url = 'https://example.com/shared'
+        first = lookup(url)
+        expected = copy.deepcopy(first)
+        first['url'] = 'mutated'
+        for value in first.values():
+            if isinstance(value, dict):
+                value.clear()
+        
+        assert lookup(url) == expected
@@ -0,0 +1,150 @@
+"""
+tests/unit/test_validator.py
+Output Validator Tests
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from core.validation import Validator
+from core.validation.validator import ValidationRule
+
+TASK = SimpleNamespace(id='task_1', step_number=1)
+GOOD_OUTPUT = {'result': 'done', 'data': {}, 'citations': ['a.pdf']}
+
+
+class TestValidationCache:
+    def test_cache_disabled_by_default(self):
+        assert Validator().cache_size == 0
+    
+    @pytest.mark.asyncio
+    async def test_passing_output_is_cached(self):
+        validator = Validator(cache_size=4)
+        result = await validator.validate(TASK, GOOD_OUTPUT)
+        assert result.passed
+        assert len(validator._cache) == 1
+    
+    @pytest.mark.asyncio
+    async def test_unencodable_output_is_not_cached(self):
+        class Source:
+            def __str__(self):
+                return 'same'
+        
+        validator = Validator(cache_size=4)
+        output = dict(GOOD_OUTPUT, source=Source())
+        result = await validator.validate(TASK, output)
+        assert result.passed
+        assert validator._signature(output) is None
+        assert not validator._cache
+
+    
+    @pytest.mark.parametrize('first, second', [
+        ((1,), [1]),
+        ({1: 'x'}, {'1': 'x'}),
+        (True, 1),
+        (0.0, -0.0),
+        (1, 1.0),
+    ])
+    def test_signature_is_type_sensitive(self, first, second):
+        assert Validator._signature({'value': first}) != Validator._signature({'value': second})
+    
+    def test_signature_ignores_key_order(self):
+        assert Validator._signature({'a': 1, 'b': [2]}) == Validator._signature({'b': [2], 'a': 1})
+    
+    @pytest.mark.asyncio
+    async def test_cached_verdict_not_reused_across_types(self):
+        validator = Validator(cache_size=4)
+        validator.add_custom_rule(ValidationRule(
+            name='list_data', description='Data must be a list', severity='low',
+            check_function=lambda output: (isinstance(output['data'], list), ['Data is not a list'])
+        ))
+        assert (await validator.validate(TASK, dict(GOOD_OUTPUT, data=[1]))).passed
+        assert not (await validator.validate(TASK, dict(GOOD_OUTPUT, data=(1,)))).passed
+
+class TestRuleEvaluation:
+    @pytest.fixture(params=[False, True], ids=['sequential', 'parallel'])
+    def validator(self, request):
+        return Validator(parallel=request.param)
+    
+    @pytest.mark.asyncio
+    async def test_good_output_passes(self, validator):
+        result = await validator.validate(TASK, GOOD_OUTPUT)
+        assert result.passed
+        assert result.severity == 'none'
+    
+    @pytest.mark.asyncio
+    async def test_issues_ordered_most_severe_first(self, validator):
+        result = await validator.validate(TASK, {'result': 'done'})
+        assert not result.passed
+        assert result.severity == 'high'
+        assert result.issues == ['Missing required field: data', 'Missing citations']
+    
+    @pytest.mark.asyncio
+    async def test_custom_low_rule(self, validator):
+        validator.add_custom_rule(ValidationRule(
+            name='style', description='Style', severity='low',
+            check_function=lambda output: (False, ['Bad style'])
+        ))
+        result = await validator.validate(TASK, GOOD_OUTPUT)
+        assert result.severity == 'low'
+        assert result.issues == ['Bad style']
+    
+    @pytest.mark.asyncio
+    async def test_critical_failure_stops_early(self, validator):
+        validator.add_custom_rule(ValidationRule(
+            name='safety', description='Safety', severity='critical',
+            check_function=lambda output: (False, ['Unsafe'])
+        ))
+        result = await validator.validate(TASK, {'result': 'done'})
+        assert result.severity == 'critical'
+        assert result.issues == ['Unsafe']
+    
+    @pytest.mark.asyncio
+    async def test_sequential_skips_rules_after_critical(self):
+        calls = []
+        validator = Validator()
+        validator.add_custom_rule(ValidationRule(
+            name='safety', description='Safety', severity='critical',
+            check_function=lambda output: (False, ['Unsafe'])
+        ))
+        validator.add_custom_rule(ValidationRule(
+            name='style', description='Style', severity='low',
+            check_function=lambda output: calls.append(output) or (True, [])
+        ))
+        await validator.validate(TASK, GOOD_OUTPUT)
+        assert calls == []
+
+
+class TestQualityScore:
+    @pytest.mark.asyncio
+    async def test_numpy_features(self):
+        np = pytest.importorskip('numpy')
+        validator = Validator()
+        
+        low = dict(GOOD_OUTPUT, features=np.array([0.2, 0.4]))
+        result = await validator.validate(TASK, low)
+        assert result.issues[0].startswith('Quality score too low')
+        
+        high = dict(GOOD_OUTPUT, features=np.array([0.9, 1.0]))
+        assert (await validator.validate(TASK, high)).passed
+    
+    @pytest.mark.asyncio
+    async def test_empty_features_use_default_score(self):
+        result = await Validator().validate(TASK, dict(GOOD_OUTPUT, features=[]))
+        assert result.passed
+
+
+class TestAsyncRules:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('parallel', [False, True], ids=['sequential', 'parallel'])
+    async def test_async_rule_is_awaited(self, parallel):
+        async def check(output):
+            return False, ['Async issue']
+        
+        validator = Validator(parallel=parallel)
+        validator.add_custom_rule(ValidationRule(
+            name='async', description='Async', severity='low', check_function=check
+        ))
+        result = await validator.validate(TASK, GOOD_OUTPUT)
+        assert result.issues == ['Async issue']
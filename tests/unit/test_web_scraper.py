@@ -0,0 +1,106 @@
+"""
+tests/unit/test_web_scraper.py
+Web Scraper Tests
+"""
+
+import asyncio
+import socket
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from ingestion.web_scraper.scraper import WebScraper, _iter_urls
+
+# Paths requested from the test server, recorded per app
+REQUESTS = web.AppKey('requests', list)
+
+
+async def page(request):
+    n = int(request.match_info['n'])
+    # Later pages answer first, so completion order differs from input order
+    await asyncio.sleep(0.01 * (5 - n))
+    return web.Response(
+        text=f'<html><head><title>Page {n}</title></head><body>Body {n}</body></html>',
+        content_type='text/html'
+    )
+
+
+async def counted(request):
+    request.app[REQUESTS].append(request.path)
+    return web.Response(text='<html><title>Counted</title></html>', content_type='text/html')
+
+
+async def pdf(request):
+    return web.Response(body=b'%PDF-1.4\n\xff\xfe\x80binary', content_type='application/pdf')
+
+
+@pytest.fixture
+async def server():
+    app = web.Application()
+    app[REQUESTS] = []
+    app.router.add_get('/counted', counted)
+    app.router.add_get('/page/{n}', page)
+    app.router.add_get('/paper.pdf', pdf)
+    async with TestServer(app) as srv:
+        yield srv
+
+
+@pytest.fixture
+def refused_url():
+    # Bind then release a port so nothing is listening on it
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    return f'http://127.0.0.1:{port}/'
+
+
+class TestIterUrls:
+    def test_skips_blanks_and_comments(self):
+        lines = [b'https://a.example\n', b'\n', b'  # note\n', b'   \n', b'  https://b.example  \n']
+        assert list(_iter_urls(lines)) == ['https://a.example', 'https://b.example']
+
+
+class TestScrapeUrlsAsync:
+    @pytest.mark.asyncio
+    async def test_results_in_input_order(self, server):
+        urls = [str(server.make_url(f'/page/{n}')) for n in range(5)]
+        results = await WebScraper().scrape_urls_async(iter(urls))
+        
+        assert [r['url'] for r in results] == urls
+        assert [r['title'] for r in results] == [f'Page {n}' for n in range(5)]
+    
+    @pytest.mark.asyncio
+    async def test_failures_carry_error(self, server, refused_url):
+        urls = [
+            str(server.make_url('/paper.pdf')),
+            refused_url,
+            str(server.make_url('/missing')),
+            str(server.make_url('/page/1')),
+        ]
+        results = await WebScraper().scrape_urls_async(urls)
+        
+        assert [r['url'] for r in results] == urls
+        assert 'error' not in results[0]
+        assert 'error' in results[1]
+        assert 'error' in results[2]
+        assert results[3]['title'] == 'Page 1'
+    
+    @pytest.mark.asyncio
+    async def test_successful_pages_are_cached(self, server):
+        url = str(server.make_url('/counted'))
+        scraper = WebScraper()
+        first, = await scraper.scrape_urls_async([url])
+        first['metadata'].clear()
+        second, = await scraper.scrape_urls_async([url])
+        
+        assert server.app[REQUESTS] == ['/counted']
+        assert second['title'] == 'Counted'
+        assert second['metadata']['author'] == 'Unknown'
+    
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, server):
+        url = str(server.make_url('/missing'))
+        scraper = WebScraper()
+        await scraper.scrape_urls_async([url])
+        assert not scraper._cache